@@ -3,13 +3,55 @@
 """
 This is the main module of the NES emulator.
 """
+import argparse
+import logging
+import os
 from nes.bus import Bus
 from nes.olc6502 import Olc6502
 
 
 if __name__ == "__main__":
-    with open("nes.log", "w", encoding="utf-8") as file:
-        pass
+    parser = argparse.ArgumentParser(description="Run the NES emulator.")
+    parser.add_argument(
+        "--step",
+        action="store_true",
+        help="single-step: wait for Enter after each instruction (q quits)",
+    )
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        default=1_000_000,
+        help="number of clock ticks to run before exiting",
+    )
+    args = parser.parse_args()
+
+    # NES_LOG_MODE picks the handlers: "off" installs a NullHandler so
+    # hot runs pay only the cheap level check, "file" skips the console
+    # handler, "rich" opts into RichHandler's markup rendering, and the
+    # default pairs the file with a plain stream handler.
+    log_mode = os.environ.get("NES_LOG_MODE", "full")
+    if log_mode == "off":
+        log_handlers = [logging.NullHandler()]
+    elif log_mode == "file":
+        log_handlers = [logging.FileHandler("nes.log", mode="w")]
+    elif log_mode == "rich":
+        # Imported here so the emulator never pays rich's import and
+        # render cost unless it was asked for.
+        from rich.logging import RichHandler
+        log_handlers = [
+            logging.FileHandler("nes.log", mode="w"),
+            RichHandler(),
+        ]
+    else:
+        log_handlers = [
+            logging.FileHandler("nes.log", mode="w"),
+            logging.StreamHandler(),
+        ]
+    logging.basicConfig(
+        level=os.environ.get("NES_LOG", "WARNING"),
+        format="%(filename)s:%(lineno)d [%(levelname)s] %(message)s",
+        handlers=log_handlers,
+    )
 
     nes = Bus()
     nes.load_to_ram(0x8000, "./cc65-example/build/bin/ex1.bin")
@@ -18,9 +60,9 @@ if __name__ == "__main__":
     nes.ram[0xFFFD] = 0x80
     cpu.reset()
 
-    while True:
+    for _ in range(args.cycles):
         cpu.clock()
-        if cpu.cycles == 0:
+        if args.step and cpu.cycles == 0:
             key = input("Enter to continue...")
             if key == "q":
                 break
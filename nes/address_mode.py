@@ -3,7 +3,7 @@ Copy-Left 2024 NES Emulator Project
 """
 import enum
 
-class AddressingMode(enum.Enum):
+class AddressingMode(enum.IntEnum):
     """
     Represents the addressing modes used in the 6502 processor.
 
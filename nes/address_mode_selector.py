@@ -2,7 +2,8 @@
 Addressing Mode Selector
 """
 
-from numpy import uint16
+from functools import partial
+
 from nes.cpu import Cpu
 from nes.address_mode import AddressingMode
 
@@ -10,195 +11,234 @@ from nes.nes_logger import setup_logger
 log = setup_logger(__name__)
 
 RequiresExtraCycle = bool
+
+# Precomputed 16-bit sign extension of a branch offset byte; indexing this
+# replaces the data-dependent `if b & 0x80` branch in REL.
+_SEX8 = tuple((b | 0xFF00) if b & 0x80 else b for b in range(256))
+
 # pylint: disable=invalid-name
-class AddressModeSelector:
+
+
+def IMP(cpu: Cpu) -> RequiresExtraCycle:
     """
-    The AddressModeSelector class is responsible for selecting the appropriate addressing mode
-    for the instructions in the NES emulator.
+    Implied addressing mode.
 
-    It provides methods for each addressing mode, such as implied, immediate, zero page, etc.,
-    which return a boolean value indicating whether an extra cycle is required for the instruction.
+    This addressing mode does not require an address,
+    as the instruction operates on the implied register.
     """
+    cpu.fetched = cpu.register.a
+    return False
 
-    def __init__(self, cpu: Cpu) -> None:
-        self.cpu = cpu
 
-    def select(self, mode: AddressingMode) -> RequiresExtraCycle:
-        """
-        Selects the appropriate addressing mode based on the given mode parameter.
+def IMM(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Immediate addressing mode.
 
-        Args:
-            mode (AddressingMode): The addressing mode to be selected.
+    This addressing mode uses the next byte as the address.
+    """
+    reg = cpu.register
+    cpu.addr_abs = reg.pc
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    log.debug("IMM: absolute address: 0x%04X", cpu.addr_abs)
+    return False
 
-        Returns:
-            RequiresExtraCycle: The result of the selected addressing mode.
-        """
-        if mode not in AddressingMode:
-            raise ValueError(f"Invalid addressing mode: {mode}")
-        return getattr(self, AddressingMode(mode).name)()
 
-    def IMP(self) -> RequiresExtraCycle:
-        """
-        Implied addressing mode.
+def ZP0(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Zero Page addressing mode.
 
-        This addressing mode does not require an address,
-        as the instruction operates on the implied register.
-        """
-        self.cpu.fetched = self.cpu.register.a
-        return False
+    This addressing mode uses the next byte as the address.
+    """
+    reg = cpu.register
+    cpu.addr_abs = cpu.read(reg.pc) & 0x00FF
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    return False
 
-    def IMM(self) -> RequiresExtraCycle:
-        """
-        Immediate addressing mode.
 
-        This addressing mode uses the next byte as the address.
-        """
-        self.cpu.addr_abs = self.cpu.register.pc
-        self.cpu.register.pc += 1
-        log.debug("IMM: absolute address: 0x%04X", self.cpu.addr_abs)
-        return False
+def ZPX(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Zero Page X addressing mode.
 
-    def ZP0(self) -> RequiresExtraCycle:
-        """
-        Zero Page addressing mode.
+    This addressing mode uses the next byte as the address, then adds the X register to it.
+    """
+    reg = cpu.register
+    cpu.addr_abs = (cpu.read(reg.pc) + reg.x) & 0x00FF
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    return False
 
-        This addressing mode uses the next byte as the address.
-        """
-        self.cpu.addr_abs = uint16(self.cpu.read(self.cpu.register.pc))
-        self.cpu.register.pc += 1
-        self.cpu.addr_abs &= uint16(0x00FF)
-        return False
 
-    def ZPX(self) -> RequiresExtraCycle:
-        """
-        Zero Page X addressing mode.
+def ZPY(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Zero Page Y addressing mode.
 
-        This addressing mode uses the next byte as the address, then adds the X register to it.
-        """
-        self.cpu.addr_abs = uint16(
-            self.cpu.read(self.cpu.register.pc) + self.cpu.register.x
-        ) & uint16(0x00FF)
-        self.cpu.register.pc += 1
-        return False
+    This addressing mode uses the next byte as the address, then adds the Y register to it.
+    """
+    reg = cpu.register
+    cpu.addr_abs = (cpu.read(reg.pc) + reg.y) & 0x00FF
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    return False
 
-    def ZPY(self) -> RequiresExtraCycle:
-        """
-        Zero Page Y addressing mode.
 
-        This addressing mode uses the next byte as the address, then adds the Y register to it.
-        """
-        self.cpu.addr_abs = uint16(
-            self.cpu.read(self.cpu.register.pc) + self.cpu.register.y
-        ) & uint16(0x00FF)
-        self.cpu.register.pc += 1
-        return False
+def REL(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Relative addressing mode.
 
-    def REL(self) -> RequiresExtraCycle:
-        """
-        Relative addressing mode.
+    This addressing mode uses the next byte as the address, then adds it to the program counter.
+    This address mode is exclusive to branch instructions. The address must reside within
+    -128 to +127 of the branch instruction, i.e. you cant directly branch to any address in
+    the addressable range.
+    """
+    reg = cpu.register
+    cpu.addr_rel = _SEX8[cpu.read(reg.pc)]
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    return False
 
-        This addressing mode uses the next byte as the address, then adds it to the program counter.
-        This address mode is exclusive to branch instructions. The address must reside within
-        -128 to +127 of the branch instruction, i.e. you cant directly branch to any address in
-        the addressable range.
-        """
-        self.cpu.addr_rel = uint16(self.cpu.read(self.cpu.register.pc))
-        self.cpu.register.pc += 1
-        if self.cpu.addr_rel & 0x80:
-            self.cpu.addr_rel |= uint16(0xFF00)
-        return False
 
-    def ABS(self) -> RequiresExtraCycle:
-        """
-        Absolute addressing mode.
+def ABS(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Absolute addressing mode.
 
-        This addressing mode uses the next two bytes as the address.
-        """
-        lo = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        hi = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        self.cpu.addr_abs = uint16((hi << 8) | lo)
-        log.debug("ABS: 0x%04X", self.cpu.addr_abs)
-        return False
-
-    def ABX(self) -> RequiresExtraCycle:
-        """
-        Absolute X addressing mode.
+    This addressing mode uses the next two bytes as the address.
+    """
+    read = cpu.read
+    reg = cpu.register
+    pc = reg.pc
+    lo = read(pc)
+    hi = read((pc + 1) & 0xFFFF)
+    reg.pc = (pc + 2) & 0xFFFF
+    cpu.addr_abs = ((hi << 8) | lo) & 0xFFFF
+    log.debug("ABS: 0x%04X", cpu.addr_abs)
+    return False
+
+
+def ABX(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Absolute X addressing mode.
 
-        This addressing mode uses the next two bytes as the address, then adds the X register to it.
-        """
-        lo = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        hi = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        self.cpu.addr_abs = uint16((hi << 8) | lo)
-        self.cpu.addr_abs += self.cpu.register.x
-        return (self.cpu.addr_abs & 0xFF00) != (uint16(hi) << 8)
-
-    def ABY(self) -> RequiresExtraCycle:
-        """
-        Absolute Y addressing mode.
+    This addressing mode uses the next two bytes as the address, then adds the X register to it.
+    """
+    read = cpu.read
+    reg = cpu.register
+    pc = reg.pc
+    lo = read(pc)
+    hi = read((pc + 1) & 0xFFFF)
+    reg.pc = (pc + 2) & 0xFFFF
+    cpu.addr_abs = (((hi << 8) | lo) + reg.x) & 0xFFFF
+    # Branchless page cross: indexing moves the high byte by at most one,
+    # so bit 0 of the high-byte XOR is the whole story.
+    return ((cpu.addr_abs >> 8) ^ hi) & 1
+
+
+def ABY(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Absolute Y addressing mode.
 
-        This addressing mode uses the next two bytes as the address,
-        then adds the Y register to it.
-        """
-        lo = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        hi = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        self.cpu.addr_abs = uint16((hi << 8) | lo)
-        self.cpu.addr_abs += self.cpu.register.y
-        return (self.cpu.addr_abs & 0xFF00) != (uint16(hi) << 8)
-
-    def IND(self) -> RequiresExtraCycle:
-        """
-        Indirect addressing mode.
+    This addressing mode uses the next two bytes as the address,
+    then adds the Y register to it.
+    """
+    read = cpu.read
+    reg = cpu.register
+    pc = reg.pc
+    lo = read(pc)
+    hi = read((pc + 1) & 0xFFFF)
+    reg.pc = (pc + 2) & 0xFFFF
+    cpu.addr_abs = (((hi << 8) | lo) + reg.y) & 0xFFFF
+    return ((cpu.addr_abs >> 8) ^ hi) & 1
 
-        This addressing mode uses the next two bytes as the address,
-        then reads the address from that location.
-        """
-        ptr_lo = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        ptr_hi = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        ptr = uint16((ptr_hi << 8) | ptr_lo)
-
-        # pylint: disable=unsupported-binary-operation
-        if ptr_lo == 0x00FF:
-            self.cpu.addr_abs = uint16(
-                self.cpu.read(ptr & uint16(0xFF00)) << 8
-            ) | uint16(self.cpu.read(ptr))
-        else:
-            self.cpu.addr_abs = uint16(self.cpu.read(uint16(ptr + 1)) << 8) | uint16(
-                self.cpu.read(ptr)
-            )
-        return False
-        # pylint: enable=unsupported-binary-operation
-
-    def IZX(self):
+
+def IND(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Indirect addressing mode.
+
+    This addressing mode uses the next two bytes as the address,
+    then reads the address from that location.
+    """
+    read = cpu.read
+    reg = cpu.register
+    pc = reg.pc
+    ptr_lo = read(pc)
+    ptr_hi = read((pc + 1) & 0xFFFF)
+    reg.pc = (pc + 2) & 0xFFFF
+    ptr = ((ptr_hi << 8) | ptr_lo) & 0xFFFF
+
+    if ptr_lo == 0x00FF:
+        cpu.addr_abs = (read(ptr & 0xFF00) << 8) | read(ptr)
+    else:
+        cpu.addr_abs = (read((ptr + 1) & 0xFFFF) << 8) | read(ptr)
+    return False
+
+
+def IZX(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Indexed Indirect X addressing mode.
+
+    This addressing mode uses the next byte as the address, then adds the X register to it.
+    """
+    read = cpu.read
+    reg = cpu.register
+    t = read(reg.pc)
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    x = reg.x
+    lo = read((t + x) & 0x00FF)
+    hi = read((t + x + 1) & 0x00FF)
+    cpu.addr_abs = (hi << 8) | lo
+    return False
+
+
+def IZY(cpu: Cpu) -> RequiresExtraCycle:
+    """
+    Indirect Indexed Y addressing mode.
+
+    This addressing mode uses the next byte as the address, then adds the Y register to it.
+    """
+    read = cpu.read
+    reg = cpu.register
+    t = read(reg.pc)
+    reg.pc = (reg.pc + 1) & 0xFFFF
+    lo = read(t)
+    hi = read((t + 1) & 0x00FF)
+    cpu.addr_abs = (((hi << 8) | lo) + reg.y) & 0xFFFF
+    return ((cpu.addr_abs >> 8) ^ hi) & 1
+
+
+# Free-function table indexed by AddressingMode value; plain functions keep
+# the dispatch picklable and avoid holding bound-method state per CPU.
+DISPATCH = (IMP, IMM, ZP0, ZPX, ZPY, REL, ABS, ABX, ABY, IND, IZX, IZY)
+
+
+class AddressModeSelector:
+    """
+    The AddressModeSelector class is responsible for selecting the appropriate addressing mode
+    for the instructions in the NES emulator.
+
+    It binds the module-level addressing-mode functions to one CPU and
+    dispatches them by AddressingMode value.
+    """
+
+    def __init__(self, cpu: Cpu) -> None:
+        self.cpu = cpu
+        self._dispatch = tuple(partial(fn, cpu) for fn in DISPATCH)
+
+    def handler(self, mode: AddressingMode):
         """
-        Indexed Indirect X addressing mode.
+        Returns the zero-argument handler bound to this CPU for the given mode.
 
-        This addressing mode uses the next byte as the address, then adds the X register to it.
+        Args:
+            mode (AddressingMode): The addressing mode to look up.
+
+        Returns:
+            Callable[[], RequiresExtraCycle]: The bound handler.
         """
-        t = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        lo = self.cpu.read((t + self.cpu.register.x) & uint16(0x00FF))
-        hi = self.cpu.read((t + self.cpu.register.x + 1) & uint16(0x00FF))
-        self.cpu.addr_abs = uint16((hi << 8) | lo)
-        return False
-
-    def IZY(self):
+        return self._dispatch[mode.value]
+
+    def select(self, mode: AddressingMode) -> RequiresExtraCycle:
         """
-        Indirect Indexed Y addressing mode.
+        Selects the appropriate addressing mode based on the given mode parameter.
 
-        This addressing mode uses the next byte as the address, then adds the Y register to it.
+        Args:
+            mode (AddressingMode): The addressing mode to be selected.
+
+        Returns:
+            RequiresExtraCycle: The result of the selected addressing mode.
         """
-        t = self.cpu.read(self.cpu.register.pc)
-        self.cpu.register.pc += 1
-        lo = self.cpu.read(uint16(t))
-        hi = self.cpu.read((t + 1) & 0x00FF)
-        self.cpu.addr_abs = uint16((hi << 8) | lo)
-        self.cpu.addr_abs += self.cpu.register.y
-        return (self.cpu.addr_abs & 0xFF00) != (uint16(hi) << 8)
+        return self._dispatch[mode.value]()
@@ -2,8 +2,7 @@
 Copy-Left 2024 NES Emulator Project
 """
 
-import numpy as np
-from numpy import uint8, uint16
+import logging
 from nes.nes_logger import setup_logger
 log = setup_logger(__name__)
 
@@ -31,10 +30,10 @@ class Bus:
         Returns:
             None
         """
-        self.ram = np.zeros(64 * 1024, dtype=uint8)
+        self.ram = bytearray(64 * 1024)
 
 
-    def write(self, addr : uint16, data : uint8) -> None:
+    def write(self, addr : int, data : int) -> None:
         """
         Write data to the specified address.
 
@@ -42,15 +41,11 @@ class Bus:
             addr: The address to write to.
             data: The data to write.
         """
-        if 0x0000 <= addr <= 0xFFFF:
-            #log.info("write 0x%02X to 0x%04X", hex(data), hex(addr))
-            log.info(f"write 0x{data:04X} to 0x{addr:04X}")
-            self.ram[addr] = int(data)
-        else:
-            log.error("Invalid address for write: 0x%04X", hex(addr))
-            raise IndexError(f"Invalid address for write: {addr:04X}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("write 0x%02X to 0x%04X", data, addr)
+        self.ram[addr & 0xFFFF] = data & 0xFF
 
-    def read(self, addr : uint16) -> uint8:
+    def read(self, addr : int) -> int:
         """
         Read data from the specified address.
 
@@ -60,12 +55,40 @@ class Bus:
         Returns:
             The data read from the address.
         """
-        if 0x0000 <= addr <= 0xFFFF:
-            log.info("read 0x%02X from 0x%04X", self.ram[addr], addr)
-            return uint8(self.ram[addr])
+        if log.isEnabledFor(logging.INFO):
+            log.info("read 0x%02X from 0x%04X", self.ram[addr & 0xFFFF], addr)
+        return self.ram[addr & 0xFFFF]
+
+    def debug_write(self, addr : int, data : int) -> None:
+        """
+        Write data to the specified address, validating the address first.
 
-        log.error("Invalid address for read: 0x%04X", hex(addr))
-        return uint8(0x00)
+        Args:
+            addr: The address to write to.
+            data: The data to write.
+
+        Raises:
+            IndexError: If the address is outside the 16-bit address space.
+        """
+        if not 0x0000 <= addr <= 0xFFFF:
+            log.error("Invalid address for write: 0x%04X", addr)
+            raise IndexError(f"Invalid address for write: {addr:04X}")
+        self.write(addr, data)
+
+    def debug_read(self, addr : int) -> int:
+        """
+        Read data from the specified address, validating the address first.
+
+        Args:
+            addr: The address to read from.
+
+        Returns:
+            The data read from the address, or 0x00 for an invalid address.
+        """
+        if not 0x0000 <= addr <= 0xFFFF:
+            log.error("Invalid address for read: 0x%04X", addr)
+            return 0x00
+        return self.read(addr)
 
     def load_to_ram(self, ram_offset: int, game_file: str) -> int:
         """
@@ -78,8 +101,6 @@ class Bus:
         """
         with open(game_file, 'rb') as f:
             data = f.read()
-            data_list = list(data)
-            for data in data_list:
-                self.ram[ram_offset] = data
-                ram_offset += 1
-        return ram_offset
+        end = ram_offset + len(data)
+        self.ram[ram_offset:end] = data
+        return end
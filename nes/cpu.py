@@ -2,7 +2,6 @@
 Interface class for CPU
 """
 
-from numpy import uint8, uint16
 from nes.register import Register
 from nes.flags import Flags
 
@@ -16,47 +15,58 @@ class Cpu:
     The Cpu class is responsible for executing instructions and managing the state of the CPU.
     """
 
+    # Fixed slots turn every cpu.<field> access into a C-level offset
+    # read instead of a dict probe; subclasses declare their own.
+    __slots__ = (
+        "register",
+        "addr_abs",
+        "addr_rel",
+        "opcode",
+        "cycles",
+        "fetched",
+    )
+
     def __init__(self):
         self.register = Register(
-            a=uint8(0),
-            x=uint8(0),
-            y=uint8(0),
-            stkp=uint8(0),
-            pc=uint16(0),
-            status=uint8(0),
+            a=0,
+            x=0,
+            y=0,
+            stkp=0,
+            pc=0,
+            status=0,
         )
 
         # Absolute Address
-        self.addr_abs: uint16 = uint16(0)
+        self.addr_abs: int = 0
 
         # Relative Address
-        self.addr_rel: uint16 = uint16(0)
+        self.addr_rel: int = 0
 
         # Current Opcode
-        self.opcode: uint8 = uint8(0)
+        self.opcode: int = 0
 
         # Current Cycles
-        self.cycles: uint8 = uint8(0)
+        self.cycles: int = 0
 
         # Fetched Data
-        self.fetched: uint8 = uint8(0)
+        self.fetched: int = 0
 
     # pylint: disable=unused-argument
     # pylint: disable=missing-function-docstring
-    def read(self, addr: uint16) -> uint8:
+    def read(self, addr: int) -> int:
         raise NotImplementedError("method must be implemented by the subclass.")
 
-    def write(self, addr: uint16, data: uint8) -> None:
+    def write(self, addr: int, data: int) -> None:
         raise NotImplementedError("method must be implemented by the subclass.")
 
     def set_flag(self, flag: Flags, value: bool) -> None:
         raise NotImplementedError("method must be implemented by the subclass.")
 
-    def get_flag(self, flag: Flags) -> uint8:
+    def get_flag(self, flag: Flags) -> int:
         raise NotImplementedError("method must be implemented by the subclass.")
 
     def clock(self) -> None:
         raise NotImplementedError("method must be implemented by the subclass.")
 
-    def fetch(self) -> uint8:
+    def fetch(self) -> int:
         raise NotImplementedError("method must be implemented by the subclass.")
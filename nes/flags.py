@@ -6,7 +6,7 @@ used in the status register of the 6502 processor.
 import enum
 
 
-class Flags(enum.Enum):
+class Flags(enum.IntFlag):
     """
     Represents the flags used in the status register of the 6502 processor.
 
@@ -31,3 +31,16 @@ class Flags(enum.Enum):
     U = 1 << 5
     V = 1 << 6
     N = 1 << 7
+
+
+# Raw status-bit constants for hot paths that cannot afford the enum
+# protocol; values mirror the Flags members above.
+# pylint: disable=invalid-name
+C = 0x01
+Z = 0x02
+I = 0x04
+D = 0x08
+B = 0x10
+U = 0x20
+V = 0x40
+N = 0x80
@@ -1,9 +1,8 @@
 """
 Implementation of the instruction selector.
 """
-from numpy import uint8, uint16
 from nes.cpu import Cpu
-from nes.flags import Flags
+from nes.flags import C, Z, I, D, B, U, V, N
 from nes.isa import InstructionLookupTable
 from nes.address_mode import AddressingMode
 from nes.opcodes import Opcodes
@@ -12,6 +11,57 @@ log = setup_logger(__name__)
 
 RequiresExtraCycle = bool
 
+# Per-opcode flag for "operates on the accumulator" (implied addressing),
+# precomputed so the shift/rotate handlers avoid a table lookup, an
+# attribute fetch and an enum comparison per call.
+_ACC_MODE = bytes(
+    1 if mode == AddressingMode.IMP else 0
+    for mode in InstructionLookupTable.modes
+)
+
+# Combined N/Z status bits for every 8-bit value, so handlers update the
+# pair with one table load instead of two set_flag calls.
+_NZ = bytes((v & N) | (Z if v == 0 else 0) for v in range(256))
+
+# Unofficial NOP variants that charge an extra cycle on a page cross;
+# hoisted so NOP does a hashed membership test instead of building and
+# scanning a list per call.
+_NOP_EXTRA = frozenset((0x1C, 0x3C, 0x5C, 0x7C, 0xDC, 0xFC))
+
+# The eight conditional branches differ only in which status bit they
+# test and against what value: (handler name, status mask, expected).
+_BRANCHES = (
+    ("BCC", C, 0), ("BCS", C, C),
+    ("BNE", Z, 0), ("BEQ", Z, Z),
+    ("BPL", N, 0), ("BMI", N, N),
+    ("BVC", V, 0), ("BVS", V, V),
+)
+
+
+def _make_branch(cpu: Cpu, mask: int, expected: int):
+    """
+    Builds the handler for one conditional branch instruction.
+
+    All branches share the same body — add the relative displacement to
+    the program counter, charging one extra cycle plus one more on a page
+    cross — so each is generated as a closure whose condition is a single
+    AND-compare on the raw status byte.
+    """
+    register = cpu.register
+
+    def branch() -> RequiresExtraCycle:
+        if (register.status & mask) == expected:
+            pc = register.pc
+            addr_abs = (pc + cpu.addr_rel) & 0xFFFF
+            # Branchless page-cross penalty: bit 8 of pc ^ target is set
+            # exactly when the branch lands on a different page.
+            cpu.cycles += 1 + (((addr_abs ^ pc) >> 8) & 1)
+            cpu.addr_abs = addr_abs
+            register.pc = addr_abs
+        return False
+
+    return branch
+
 class InstructionSelector:
     """
     The InstructionSelector class is responsible for selecting and executing
@@ -20,23 +70,98 @@ class InstructionSelector:
 
     def __init__(self, cpu: Cpu):
         self.cpu = cpu
+        # Pre-bound references: one attribute lookup at build time instead
+        # of a two-level self.cpu.<attr> resolution per call.
+        self._reg = cpu.register
+        self._read = cpu.read
+        self._write = cpu.write
+        self._fetch = cpu.fetch
+        self._stack = cpu.stack
+        # Conditional branches are generated closures (see _make_branch);
+        # bind them before the dispatch table is built so both the table
+        # and getattr-based callers pick them up.
+        for name, mask, expected in _BRANCHES:
+            setattr(self, name, _make_branch(cpu, mask, expected))
+        # Jump table indexed by Opcodes value, built once so dispatch is a
+        # single index + call instead of per-call enum name resolution.
+        self._dispatch: list = [self._jam] * 256
+        for op in Opcodes:
+            handler = getattr(self, op.name, None)
+            if handler is not None:
+                self._dispatch[op.value] = handler
 
     def select(self, opcode: Opcodes) -> RequiresExtraCycle:
         """
         Selects and executes the appropriate instruction based on the given opcode.
 
         Args:
-            opcode (Opcodes): The opcode representing the instruction to be executed.
+            opcode (Opcodes): The opcode representing the instruction to be
+                executed, or its raw integer value.
 
         Returns:
             RequiresExtraCycle: The result of executing the instruction.
 
         Raises:
-            ValueError: If the opcode is invalid.
+            ValueError: If the opcode is invalid (the JAM slot holds the
+                _jam handler, so no separate enum comparison is needed).
         """
-        if opcode == Opcodes.JAM:
-            raise ValueError(f"Invalid opcode: {opcode}")
-        return getattr(self, Opcodes(opcode).name)()
+        if isinstance(opcode, Opcodes):
+            opcode = opcode.value
+        return self._dispatch[opcode]()
+
+    def _jam(self) -> RequiresExtraCycle:
+        """
+        Fallback handler occupying every dispatch slot without an
+        implemented instruction, so lookup needs no per-call existence
+        check.
+        """
+        raise ValueError(f"Invalid opcode: {Opcodes.JAM}")
+
+    def _set_nz(self, value: int) -> None:
+        """
+        Updates the Z and N flags from an 8-bit result via the _NZ table.
+        """
+        reg = self._reg
+        reg.status = (reg.status & ~(Z | N)) | _NZ[value & 0xFF]
+
+    def _pull_u8(self) -> int:
+        """
+        Pulls one byte off the stack via the direct stack-page view.
+        """
+        reg = self._reg
+        reg.stkp = (reg.stkp + 1) & 0xFF
+        return self._stack[reg.stkp]
+
+    def _pull_u16(self) -> int:
+        """
+        Pulls a 16-bit little-endian word off the stack.
+        """
+        lo = self._pull_u8()
+        hi = self._pull_u8()
+        return lo | (hi << 8)
+
+    def _cmp(self, value: int) -> None:
+        """
+        Shared core of CMP/CPX/CPY: compares a register value against the
+        fetched operand, updating C, Z and N in one status write.
+        """
+        fetched = self._fetch()
+        reg = self._reg
+        reg.status = (
+            (reg.status & ~(C | Z | N))
+            | (C if value >= fetched else 0)
+            | _NZ[(value - fetched) & 0xFF]
+        )
+
+    def _step(self, attr: str, delta: int) -> None:
+        """
+        Shared core of INX/INY/DEX/DEY: steps a register by +/-1 with
+        wraparound and updates Z and N from the result.
+        """
+        reg = self._reg
+        value = (getattr(reg, attr) + delta) & 0xFF
+        setattr(reg, attr, value)
+        self._set_nz(value)
 
     # pylint: disable=invalid-name
     def ADC(self) -> RequiresExtraCycle:
@@ -48,30 +173,27 @@ class InstructionSelector:
         enables multiple byte addition to be performed.
         """
         # Fetch the value from memory
-        fetched = uint16(self.cpu.fetch())
+        fetched = self._fetch()
+        reg = self._reg
+        a = reg.a
+        status = reg.status
 
         # Perform the addition with carry
-        temp = (
-            uint16(self.cpu.register.a) + fetched + uint16(self.cpu.get_flag(Flags.C))
-        )
-
-        # Set the carry flag if overflow occurs
-        self.cpu.set_flag(Flags.C, bool(temp > uint16(0x00FF)))
-
-        # Set the zero flag if the result is zero
-        self.cpu.set_flag(Flags.Z, bool((temp & uint16(0x00FF)) == 0))
-
-        # Set the negative flag if the result is negative
-        self.cpu.set_flag(Flags.N, bool(temp & uint16(0x0080)))
-
-        # Calculate the overflow flag
-        a = uint16(self.cpu.register.a)
-        self.cpu.set_flag(
-            Flags.V, bool(uint16(~(a ^ fetched) & (a ^ temp)) & uint16(0x0080))
+        temp = a + fetched + (status & C)
+
+        # Recompute C, Z, V and N with direct bit arithmetic and write the
+        # status register back once (V is N's formula shifted into bit 6).
+        status = (
+            (status & ~(C | Z | V | N))
+            | ((temp >> 8) & C)
+            | (Z if (temp & 0x00FF) == 0 else 0)
+            | (temp & N)
+            | (((~(a ^ fetched) & (a ^ temp)) & 0x0080) >> 1)
         )
+        reg.status = status
 
         # Store the result in the accumulator
-        self.cpu.register.a = uint8(temp & uint16(0x00FF))
+        reg.a = temp & 0x00FF
 
         return True
 
@@ -84,31 +206,28 @@ class InstructionSelector:
         enables multiple byte addition to be performed.
         """
         # Fetch the value from memory
-        fetched = uint16(self.cpu.fetch())
-
-        # Perform the subtraction with carry
-        value = uint16(uint16(fetched) ^ uint16(0x00FF))
-        log.debug("Fetched: %d(0x%x), Value: %d(0x%x)", fetched, fetched, value, value)
-        log.debug("A: %d(0x%x), C: %d", self.cpu.register.a, self.cpu.register.a, self.cpu.get_flag(Flags.C))
-        temp = uint16(self.cpu.register.a) + value + uint16(self.cpu.get_flag(Flags.C))
-        log.debug("Temp: %d(0x%x)", temp, temp)
-        # Set the carry flag if overflow occurs
-        self.cpu.set_flag(Flags.C, bool(temp & uint16(0xFF00)))
-
-        # Set the zero flag if the result is zero
-        self.cpu.set_flag(Flags.Z, bool((temp & uint16(0x00FF)) == 0))
-
-        # Set the negative flag if the result is negative
-        self.cpu.set_flag(Flags.N, bool(temp & uint16(0x0080)))
-
-        # Calculate the overflow flag
-        a = uint16(self.cpu.register.a)
-        self.cpu.set_flag(
-            Flags.V, bool(uint16((a ^ value) & (a ^ temp)) & uint16(0x0080))
+        fetched = self._fetch()
+        reg = self._reg
+        a = reg.a
+        status = reg.status
+
+        # Perform the subtraction with carry (addition of the complement)
+        value = fetched ^ 0x00FF
+        temp = a + value + (status & C)
+
+        # Recompute C, Z, V and N with direct bit arithmetic and write the
+        # status register back once (V is N's formula shifted into bit 6).
+        status = (
+            (status & ~(C | Z | V | N))
+            | ((temp >> 8) & C)
+            | (Z if (temp & 0x00FF) == 0 else 0)
+            | (temp & N)
+            | ((((a ^ value) & (a ^ temp)) & 0x0080) >> 1)
         )
+        reg.status = status
 
         # Store the result in the accumulator
-        self.cpu.register.a = uint8(temp & uint16(0x00FF))
+        reg.a = temp & 0x00FF
 
         return True
 
@@ -119,10 +238,9 @@ class InstructionSelector:
         This instruction performs a bitwise AND between the accumulator
         and the fetched value. The result is stored in the accumulator.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.a &= fetched
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        reg = self._reg
+        reg.a &= self._fetch()
+        self._set_nz(reg.a)
         return True
 
     def ASL(self) -> RequiresExtraCycle:
@@ -133,69 +251,16 @@ class InstructionSelector:
         one position to the left. The bit that was in bit 7 is shifted into
         the carry flag. Bit 0 is set to 0.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(uint16(fetched) << 1)
-        self.cpu.set_flag(Flags.C, bool(temp & 0xFF00))
-        self.cpu.set_flag(Flags.Z, (temp & 0x00FF) == 0x00)
-        self.cpu.set_flag(Flags.N, bool(temp & 0x80))
+        fetched = self._fetch()
+        reg = self._reg
+        temp = fetched << 1
+        reg.status = (reg.status & ~C) | ((temp >> 8) & C)
+        self._set_nz(temp)
 
-        instruction = InstructionLookupTable.table[self.cpu.opcode]
-        addr_mode = instruction.addr_mode
-        if addr_mode == AddressingMode.IMP:
-            self.cpu.register.a = uint8(temp & 0x00FF)
+        if _ACC_MODE[self.cpu.opcode]:
+            reg.a = temp & 0x00FF
         else:
-            self.cpu.write(self.cpu.addr_abs, uint8(temp & 0x00FF))
-        return False
-
-    def BCC(self) -> RequiresExtraCycle:
-        """
-        Branch if Carry Clear.
-
-        This instruction adds the relative displacement to the
-        program counter if the carry flag is clear.
-        """
-        if self.cpu.get_flag(Flags.C) == 0:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
-        return False
-
-    def BCS(self) -> RequiresExtraCycle:
-        """
-        Branch if Carry Set.
-
-        This instruction adds the relative displacement to the
-        program counter if the carry flag is set.
-        """
-        if self.cpu.get_flag(Flags.C) == 1:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
-        return False
-
-    def BEQ(self) -> RequiresExtraCycle:
-        """
-        Branch if Equal.
-
-        This instruction adds the relative displacement to the
-        program counter if the zero flag is set.
-        """
-        if self.cpu.get_flag(Flags.Z) == 1:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
+            self._write(self.cpu.addr_abs, temp & 0x00FF)
         return False
 
     def BIT(self) -> RequiresExtraCycle:
@@ -204,62 +269,15 @@ class InstructionSelector:
 
         This instruction is used to test bits in memory with the accumulator.
         """
-        fetched = self.cpu.fetch()
-        temp = self.cpu.register.a & fetched
-        self.cpu.set_flag(Flags.Z, temp == 0x00)
-        self.cpu.set_flag(Flags.N, bool(fetched & (1 << 7)))
-        self.cpu.set_flag(Flags.V, bool(fetched & (1 << 6)))
-        return False
-
-    def BMI(self) -> RequiresExtraCycle:
-        """
-        Branch if Minus.
-
-        This instruction adds the relative displacement to the
-        program counter if the negative flag is set.
-        """
-        if self.cpu.get_flag(Flags.N) == 1:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
-        return False
-
-    def BNE(self) -> RequiresExtraCycle:
-        """
-        Branch if Not Equal.
-
-        This instruction adds the relative displacement to the
-        program counter if the zero flag is clear.
-        """
-        if self.cpu.get_flag(Flags.Z) == 0:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
-        return False
-
-    def BPL(self) -> RequiresExtraCycle:
-        """
-        Branch if Positive.
-
-        This instruction adds the relative displacement to the
-        program counter if the negative flag is clear.
-        """
-        if self.cpu.get_flag(Flags.N) == 0:
-            self.cpu.cycles += 1
-            self.cpu.addr_abs = self.cpu.register.pc + self.cpu.addr_rel
-
-            if (self.cpu.addr_abs & 0xFF00) != (self.cpu.register.pc & 0xFF00):
-                self.cpu.cycles += 1
-
-            self.cpu.register.pc = self.cpu.addr_abs
+        fetched = self._fetch()
+        reg = self._reg
+        # Z from the AND result; V and N copied straight from operand
+        # bits 6 and 7.
+        reg.status = (
+            (reg.status & ~(Z | V | N))
+            | (Z if (reg.a & fetched) == 0 else 0)
+            | (fetched & (V | N))
+        )
         return False
 
     def BRK(self) -> RequiresExtraCycle:
@@ -268,24 +286,19 @@ class InstructionSelector:
 
         This instruction forces the generation of an interrupt request.
         """
-        self.cpu.register.pc += 1
-        self.cpu.set_flag(Flags.I, True)
-        self.cpu.write(
-            self.cpu.register.stkp + 0x0100, (self.cpu.register.pc >> 8) & 0x00FF
-        )
-        self.cpu.register.stkp -= 1
-        self.cpu.write(self.cpu.register.stkp + 0x0100, self.cpu.register.pc & 0x00FF)
-        self.cpu.register.stkp -= 1
-        self.cpu.set_flag(Flags.B, True)
-        self.cpu.write(self.cpu.register.stkp, self.cpu.register.status)
-        self.cpu.register.stkp -= 1
-        self.cpu.set_flag(Flags.B, False)
-        # pylint: disable=unsupported-binary-operation
-        self.cpu.register.pc = uint16(
-            uint16(self.cpu.read(uint16(0xFFFE)))
-            | (uint16(uint16(self.cpu.read(uint16(0xFFFF)))) << 8)
-        )
-        # pylint: enable=unsupported-binary-operation
+        reg = self._reg
+        stack = self._stack
+        pc = (reg.pc + 1) & 0xFFFF
+        reg.status |= I
+        # All three pushes land in the stack page; store them against one
+        # local stack pointer and write stkp back once.
+        stkp = reg.stkp
+        stack[stkp] = pc >> 8
+        stack[(stkp - 1) & 0xFF] = pc & 0x00FF
+        # B is only set on the pushed copy, never in the live register
+        stack[(stkp - 2) & 0xFF] = reg.status | B
+        reg.stkp = (stkp - 3) & 0xFF
+        reg.pc = self._read(0xFFFE) | (self._read(0xFFFF) << 8)
         return False
 
     def CLC(self) -> RequiresExtraCycle:
@@ -294,7 +307,7 @@ class InstructionSelector:
 
         This instruction clears the carry flag.
         """
-        self.cpu.set_flag(Flags.C, False)
+        self._reg.status &= ~C
         return False
 
     def CLD(self) -> RequiresExtraCycle:
@@ -303,7 +316,7 @@ class InstructionSelector:
 
         This instruction clears the decimal mode flag.
         """
-        self.cpu.set_flag(Flags.D, False)
+        self._reg.status &= ~D
         return False
 
     def CLI(self) -> RequiresExtraCycle:
@@ -312,7 +325,7 @@ class InstructionSelector:
 
         This instruction clears the interrupt disable flag.
         """
-        self.cpu.set_flag(Flags.I, False)
+        self._reg.status &= ~I
         return False
 
     def CLV(self) -> RequiresExtraCycle:
@@ -321,7 +334,7 @@ class InstructionSelector:
 
         This instruction clears the overflow flag.
         """
-        self.cpu.set_flag(Flags.V, False)
+        self._reg.status &= ~V
         return False
 
     def CMP(self) -> RequiresExtraCycle:
@@ -330,11 +343,7 @@ class InstructionSelector:
 
         This instruction compares the contents of the accumulator with another value.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(self.cpu.register.a) - uint16(fetched)
-        self.cpu.set_flag(Flags.C, bool(self.cpu.register.a >= fetched))
-        self.cpu.set_flag(Flags.Z, bool((temp & 0x00FF) == 0x0000))
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
+        self._cmp(self._reg.a)
         return True
 
     def CPX(self) -> RequiresExtraCycle:
@@ -343,11 +352,7 @@ class InstructionSelector:
 
         This instruction compares the contents of the X register with another value.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(self.cpu.register.x) - uint16(fetched)
-        self.cpu.set_flag(Flags.C, bool(self.cpu.register.x >= fetched))
-        self.cpu.set_flag(Flags.Z, bool((temp & 0x00FF) == 0x0000))
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
+        self._cmp(self._reg.x)
         return False
 
     def CPY(self) -> RequiresExtraCycle:
@@ -356,11 +361,7 @@ class InstructionSelector:
 
         This instruction compares the contents of the Y register with another value.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(self.cpu.register.y) - uint16(fetched)
-        self.cpu.set_flag(Flags.C, bool(self.cpu.register.y >= fetched))
-        self.cpu.set_flag(Flags.Z, bool((temp & 0x00FF) == 0x0000))
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
+        self._cmp(self._reg.y)
         return False
 
     def DEC(self) -> RequiresExtraCycle:
@@ -369,11 +370,10 @@ class InstructionSelector:
 
         This instruction decrements the value of a memory location.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(fetched) - 1
-        self.cpu.write(self.cpu.addr_abs, temp & 0x00FF)
-        self.cpu.set_flag(Flags.Z, bool((temp & 0x00FF) == 0x0000))
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
+        fetched = self._fetch()
+        temp = (fetched - 1) & 0xFFFF
+        self._write(self.cpu.addr_abs, temp & 0x00FF)
+        self._set_nz(temp)
         return False
 
     def DEX(self) -> RequiresExtraCycle:
@@ -382,9 +382,7 @@ class InstructionSelector:
 
         This instruction decrements the value of the X register.
         """
-        self.cpu.register.x -= 1
-        self.cpu.set_flag(Flags.Z, bool(self.cpu.register.x == 0x00))
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.x & 0x80))
+        self._step("x", -1)
         return False
 
     def DEY(self) -> RequiresExtraCycle:
@@ -393,9 +391,7 @@ class InstructionSelector:
 
         This instruction decrements the value of the Y register.
         """
-        self.cpu.register.y -= 1
-        self.cpu.set_flag(Flags.Z, bool(self.cpu.register.y == 0x00))
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.y & 0x80))
+        self._step("y", -1)
         return False
 
     def EOR(self) -> RequiresExtraCycle:
@@ -405,10 +401,9 @@ class InstructionSelector:
         This instruction performs a bitwise exclusive OR between the accumulator
         and the fetched value. The result is stored in the accumulator.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.a ^= fetched
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & 0x80))
+        reg = self._reg
+        reg.a ^= self._fetch()
+        self._set_nz(reg.a)
         return True
 
     def INC(self) -> RequiresExtraCycle:
@@ -417,11 +412,10 @@ class InstructionSelector:
 
         This instruction increments the value of a memory location.
         """
-        fetched = self.cpu.fetch()
-        temp = uint16(fetched) + 1
-        self.cpu.write(self.cpu.addr_abs, temp & 0x00FF)
-        self.cpu.set_flag(Flags.Z, bool((temp & 0x00FF) == 0x0000))
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
+        fetched = self._fetch()
+        temp = (fetched + 1) & 0xFFFF
+        self._write(self.cpu.addr_abs, temp & 0x00FF)
+        self._set_nz(temp)
         return False
 
     def INX(self) -> RequiresExtraCycle:
@@ -430,9 +424,7 @@ class InstructionSelector:
 
         This instruction increments the value of the X register.
         """
-        self.cpu.register.x += 1
-        self.cpu.set_flag(Flags.Z, bool(self.cpu.register.x == 0x00))
-        self.cpu.set_flag(Flags.N, self.cpu.register.x & uint8(0x80))
+        self._step("x", +1)
         return False
 
     def INY(self) -> RequiresExtraCycle:
@@ -441,9 +433,7 @@ class InstructionSelector:
 
         This instruction increments the value of the Y register.
         """
-        self.cpu.register.y += 1
-        self.cpu.set_flag(Flags.Z, bool(self.cpu.register.y == 0x00))
-        self.cpu.set_flag(Flags.N, self.cpu.register.y & uint8(0x80))
+        self._step("y", +1)
         return False
 
     def JMP(self) -> RequiresExtraCycle:
@@ -452,7 +442,7 @@ class InstructionSelector:
 
         This instruction sets the program counter to a new location.
         """
-        self.cpu.register.pc = self.cpu.addr_abs
+        self._reg.pc = self.cpu.addr_abs
         return False
 
     def JSR(self) -> RequiresExtraCycle:
@@ -462,14 +452,14 @@ class InstructionSelector:
         This instruction pushes the program counter minus one to the stack
         and sets the program counter to a new location.
         """
-        self.cpu.register.pc -= 1
-        self.cpu.write(
-            0x0100 + self.cpu.register.stkp, (self.cpu.register.pc >> 8) & 0x00FF
-        )
-        self.cpu.register.stkp -= 1
-        self.cpu.write(0x0100 + self.cpu.register.stkp, self.cpu.register.pc & 0x00FF)
-        self.cpu.register.stkp -= 1
-        self.cpu.register.pc = self.cpu.addr_abs
+        reg = self._reg
+        stack = self._stack
+        pc = (reg.pc - 1) & 0xFFFF
+        stkp = reg.stkp
+        stack[stkp] = (pc >> 8) & 0x00FF
+        stack[(stkp - 1) & 0xFF] = pc & 0x00FF
+        reg.stkp = (stkp - 2) & 0xFF
+        reg.pc = self.cpu.addr_abs
         return False
 
     def LDA(self) -> RequiresExtraCycle:
@@ -478,11 +468,10 @@ class InstructionSelector:
 
         This instruction loads a value into the accumulator.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.a = fetched
+        fetched = self._fetch()
+        self._reg.a = fetched
         log.debug("Loaded %d(0x%x) into accumulator", fetched, fetched)
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        self._set_nz(fetched)
         return True
 
     def LDX(self) -> RequiresExtraCycle:
@@ -491,10 +480,9 @@ class InstructionSelector:
 
         This instruction loads a value into the X register.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.x = fetched
-        self.cpu.set_flag(Flags.Z, self.cpu.register.x == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.x & uint8(0x80)))
+        fetched = self._fetch()
+        self._reg.x = fetched
+        self._set_nz(fetched)
         return True
 
     def LDY(self) -> RequiresExtraCycle:
@@ -503,10 +491,9 @@ class InstructionSelector:
 
         This instruction loads a value into the Y register.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.y = fetched
-        self.cpu.set_flag(Flags.Z, self.cpu.register.y == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.y & uint8(0x80)))
+        fetched = self._fetch()
+        self._reg.y = fetched
+        self._set_nz(fetched)
         return True
 
     def LSR(self) -> RequiresExtraCycle:
@@ -517,17 +504,15 @@ class InstructionSelector:
         one position to the right. The bit that was in bit 0 is shifted into
         the carry flag. Bit 7 is set to 0.
         """
-        fetched = uint16(self.cpu.fetch())
-        self.cpu.set_flag(Flags.C, bool(fetched & 0x0001))
-        temp = uint16(fetched) >> 1
-        self.cpu.set_flag(Flags.Z, (temp & 0x00FF) == 0x0000)
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
-        instruction = InstructionLookupTable.table[self.cpu.opcode]
-        addr_mode = instruction.addr_mode
-        if addr_mode == AddressingMode.IMP:
-            self.cpu.register.a = uint8(temp & 0x00FF)
+        fetched = self._fetch()
+        reg = self._reg
+        reg.status = (reg.status & ~C) | (fetched & C)
+        temp = fetched >> 1
+        self._set_nz(temp)
+        if _ACC_MODE[self.cpu.opcode]:
+            reg.a = temp & 0x00FF
         else:
-            self.cpu.write(self.cpu.addr_abs, uint8(temp & 0x00FF))
+            self._write(self.cpu.addr_abs, temp & 0x00FF)
 
         return False
 
@@ -540,7 +525,7 @@ class InstructionSelector:
         Returns:
             bool: True if the instruction requires an extra cycle, False otherwise.
         """
-        return self.cpu.opcode in [0x1C, 0x3C, 0x5C, 0x7C, 0xDC, 0xFC]
+        return self.cpu.opcode in _NOP_EXTRA
 
     def ORA(self) -> RequiresExtraCycle:
         """
@@ -549,10 +534,9 @@ class InstructionSelector:
         This instruction performs a bitwise OR between the accumulator
         and the fetched value. The result is stored in the accumulator.
         """
-        fetched = self.cpu.fetch()
-        self.cpu.register.a |= fetched
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        reg = self._reg
+        reg.a |= self._fetch()
+        self._set_nz(reg.a)
         return True
 
     def PHA(self) -> RequiresExtraCycle:
@@ -561,8 +545,9 @@ class InstructionSelector:
 
         This instruction pushes the accumulator onto the stack.
         """
-        self.cpu.write(0x0100 + self.cpu.register.stkp, self.cpu.register.a)
-        self.cpu.register.stkp -= 1
+        reg = self._reg
+        self._stack[reg.stkp] = reg.a
+        reg.stkp = (reg.stkp - 1) & 0xFF
         return False
 
     def PHP(self) -> RequiresExtraCycle:
@@ -571,13 +556,10 @@ class InstructionSelector:
 
         This instruction pushes the processor status onto the stack.
         """
-        self.cpu.write(
-            0x0100 + self.cpu.register.stkp,
-            uint8(self.cpu.register.status | Flags.B.value | Flags.U.value),
-        )
-        self.cpu.set_flag(Flags.B, False)
-        self.cpu.set_flag(Flags.U, False)
-        self.cpu.register.stkp -= 1
+        reg = self._reg
+        self._stack[reg.stkp] = reg.status | B | U
+        reg.status &= ~(B | U)
+        reg.stkp = (reg.stkp - 1) & 0xFF
         return False
 
     def PLA(self) -> RequiresExtraCycle:
@@ -586,10 +568,10 @@ class InstructionSelector:
 
         This instruction pulls a value from the stack into the accumulator.
         """
-        self.cpu.register.stkp += 1
-        self.cpu.register.a = self.cpu.read(0x0100 + self.cpu.register.stkp)
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        reg = self._reg
+        reg.stkp = (reg.stkp + 1) & 0xFF
+        reg.a = self._stack[reg.stkp]
+        self._set_nz(reg.a)
         return False
 
     def PLP(self) -> RequiresExtraCycle:
@@ -598,9 +580,10 @@ class InstructionSelector:
 
         This instruction pulls a value from the stack into the processor status.
         """
-        self.cpu.register.stkp += 1
-        self.cpu.register.status = self.cpu.read(0x0100 + self.cpu.register.stkp)
-        self.cpu.set_flag(Flags.U, True)
+        reg = self._reg
+        reg.stkp = (reg.stkp + 1) & 0xFF
+        reg.status = self._stack[reg.stkp]
+        reg.status |= U
         return False
 
     def ROL(self) -> RequiresExtraCycle:
@@ -611,18 +594,15 @@ class InstructionSelector:
         one position to the left. The bit that was in bit 7 is shifted into
         the carry flag. Bit 0 is set to the value of the carry flag.
         """
-        fetched = uint16(self.cpu.fetch())
-        temp = uint16(fetched << 1) | uint16(self.cpu.get_flag(Flags.C))
-        # pylint: disable=unsupported-binary-operation
-        self.cpu.set_flag(Flags.C, bool(temp & 0xFF00))
-        self.cpu.set_flag(Flags.Z, (temp & 0x00FF) == 0x00)
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
-        instruction = InstructionLookupTable.table[self.cpu.opcode]
-        addr_mode = instruction.addr_mode
-        if addr_mode == AddressingMode.IMP:
-            self.cpu.register.a = uint8(temp & 0x00FF)
+        fetched = self._fetch()
+        reg = self._reg
+        temp = (fetched << 1) | (reg.status & C)
+        reg.status = (reg.status & ~C) | ((temp >> 8) & C)
+        self._set_nz(temp)
+        if _ACC_MODE[self.cpu.opcode]:
+            reg.a = temp & 0x00FF
         else:
-            self.cpu.write(self.cpu.addr_abs, uint8(temp & 0x00FF))
+            self._write(self.cpu.addr_abs, temp & 0x00FF)
         return False
 
     def ROR(self) -> RequiresExtraCycle:
@@ -633,19 +613,15 @@ class InstructionSelector:
         one position to the right. The bit that was in bit 0 is shifted into
         the carry flag. Bit 7 is set to the value of the carry flag.
         """
-        fetched = self.cpu.fetch()
-        # pylint: disable=unsupported-binary-operation
-        temp = uint16((uint16(fetched) >> 1)) | uint16(uint16(self.cpu.get_flag(Flags.C)) << 7)
-        # pylint: enable=unsupported-binary-operation
-        self.cpu.set_flag(Flags.C, bool(fetched & 0x01))
-        self.cpu.set_flag(Flags.Z, (temp & 0x00FF) == 0x00)
-        self.cpu.set_flag(Flags.N, bool(temp & 0x0080))
-        instruction = InstructionLookupTable.table[self.cpu.opcode]
-        addr_mode = instruction.addr_mode
-        if addr_mode == AddressingMode.IMP:
-            self.cpu.register.a = uint8(temp & 0x00FF)
+        fetched = self._fetch()
+        reg = self._reg
+        temp = (fetched >> 1) | ((reg.status & C) << 7)
+        reg.status = (reg.status & ~C) | (fetched & C)
+        self._set_nz(temp)
+        if _ACC_MODE[self.cpu.opcode]:
+            reg.a = temp & 0x00FF
         else:
-            self.cpu.write(self.cpu.addr_abs, uint8(temp & 0x00FF))
+            self._write(self.cpu.addr_abs, temp & 0x00FF)
 
         return False
 
@@ -656,12 +632,7 @@ class InstructionSelector:
         This instruction pulls the program counter from the stack and
         adds one to it.
         """
-        self.cpu.register.stkp += 1
-        self.cpu.register.pc = uint16(self.cpu.read(0x0100 + self.cpu.register.stkp))
-        self.cpu.register.stkp += 1
-        self.cpu.register.pc = uint16(
-            uint16(self.cpu.read(0x0100 + self.cpu.register.stkp)) << 8
-        )
+        self._reg.pc = (self._pull_u16() + 1) & 0xFFFF
         return False
 
     def SEC(self) -> RequiresExtraCycle:
@@ -670,7 +641,7 @@ class InstructionSelector:
 
         This instruction sets the carry flag.
         """
-        self.cpu.set_flag(Flags.C, True)
+        self._reg.status |= C
         return False
 
     def SED(self) -> RequiresExtraCycle:
@@ -679,7 +650,7 @@ class InstructionSelector:
 
         This instruction sets the decimal mode flag.
         """
-        self.cpu.set_flag(Flags.D, True)
+        self._reg.status |= D
         return False
 
     def SEI(self) -> RequiresExtraCycle:
@@ -688,7 +659,7 @@ class InstructionSelector:
 
         This instruction sets the interrupt disable flag.
         """
-        self.cpu.set_flag(Flags.I, True)
+        self._reg.status |= I
         return False
 
     def STA(self) -> RequiresExtraCycle:
@@ -697,7 +668,7 @@ class InstructionSelector:
 
         This instruction stores the value of the accumulator in memory.
         """
-        self.cpu.write(self.cpu.addr_abs, self.cpu.register.a)
+        self._write(self.cpu.addr_abs, self._reg.a)
         return False
 
     def STX(self) -> RequiresExtraCycle:
@@ -706,7 +677,7 @@ class InstructionSelector:
 
         This instruction stores the value of the X register in memory.
         """
-        self.cpu.write(self.cpu.addr_abs, self.cpu.register.x)
+        self._write(self.cpu.addr_abs, self._reg.x)
         return False
 
     def STY(self) -> RequiresExtraCycle:
@@ -715,7 +686,7 @@ class InstructionSelector:
 
         This instruction stores the value of the Y register in memory.
         """
-        self.cpu.write(self.cpu.addr_abs, self.cpu.register.y)
+        self._write(self.cpu.addr_abs, self._reg.y)
         return False
 
     def TAX(self) -> RequiresExtraCycle:
@@ -724,9 +695,9 @@ class InstructionSelector:
 
         This instruction transfers the value of the accumulator to the X register.
         """
-        self.cpu.register.x = self.cpu.register.a
-        self.cpu.set_flag(Flags.Z, self.cpu.register.x == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.x & uint8(0x80)))
+        reg = self._reg
+        reg.x = reg.a
+        self._set_nz(reg.x)
         return False
 
     def TAY(self) -> RequiresExtraCycle:
@@ -735,9 +706,9 @@ class InstructionSelector:
 
         This instruction transfers the value of the accumulator to the Y register.
         """
-        self.cpu.register.y = self.cpu.register.a
-        self.cpu.set_flag(Flags.Z, self.cpu.register.y == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.y & uint8(0x80)))
+        reg = self._reg
+        reg.y = reg.a
+        self._set_nz(reg.y)
         return False
 
     def TSX(self) -> RequiresExtraCycle:
@@ -746,9 +717,9 @@ class InstructionSelector:
 
         This instruction transfers the value of the stack pointer to the X register.
         """
-        self.cpu.register.x = self.cpu.register.stkp
-        self.cpu.set_flag(Flags.Z, self.cpu.register.x == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.x & uint8(0x80)))
+        reg = self._reg
+        reg.x = reg.stkp
+        self._set_nz(reg.x)
         return False
 
     def TXA(self) -> RequiresExtraCycle:
@@ -757,9 +728,9 @@ class InstructionSelector:
 
         This instruction transfers the value of the X register to the accumulator.
         """
-        self.cpu.register.a = self.cpu.register.x
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        reg = self._reg
+        reg.a = reg.x
+        self._set_nz(reg.a)
         return False
 
     def TXS(self) -> RequiresExtraCycle:
@@ -768,7 +739,7 @@ class InstructionSelector:
 
         This instruction transfers the value of the X register to the stack pointer.
         """
-        self.cpu.register.stkp = self.cpu.register.x
+        self._reg.stkp = self._reg.x
         return False
 
     def TYA(self) -> RequiresExtraCycle:
@@ -777,9 +748,9 @@ class InstructionSelector:
 
         This instruction transfers the value of the Y register to the accumulator.
         """
-        self.cpu.register.a = self.cpu.register.y
-        self.cpu.set_flag(Flags.Z, self.cpu.register.a == 0x00)
-        self.cpu.set_flag(Flags.N, bool(self.cpu.register.a & uint8(0x80)))
+        reg = self._reg
+        reg.a = reg.y
+        self._set_nz(reg.a)
         return False
 
     def RTI(self) -> RequiresExtraCycle:
@@ -789,15 +760,7 @@ class InstructionSelector:
         This method is called when the processor returns from an interrupt,
         setting the program counter to the address stored on the stack.
         """
-        self.cpu.register.stkp += 1
-        self.cpu.register.status = self.cpu.read(0x0100 + self.cpu.register.stkp)
-        self.cpu.register.status &= uint8(~Flags.B.value)
-        self.cpu.register.status &= uint8(~Flags.U.value)
-
-        self.cpu.register.stkp += 1
-        self.cpu.register.pc = uint16(self.cpu.read(0x0100 + self.cpu.register.stkp))
-        self.cpu.register.stkp += 1
-        hi = self.cpu.read(0x0100 + self.cpu.register.stkp)
-        self.cpu.register.pc |= uint16(uint16(hi) << 8)
-
+        reg = self._reg
+        reg.status = self._pull_u8() & ~(B | U)
+        reg.pc = self._pull_u16()
         return False
@@ -2,12 +2,16 @@
 This module contains the logger setup function for the NES project.
 """
 import logging
-from rich.logging import RichHandler
 
 def setup_logger(logger_name: str) -> logging.Logger:
     """
     Set up a logger with the specified name.
 
+    Library modules only name their logger here; handlers, level and
+    formatting are configured once by the application entry point, so
+    importing the emulator never installs handlers or forces DEBUG
+    rendering on the memory hot path.
+
     Args:
         logger_name (str): The name of the logger.
 
@@ -15,12 +19,4 @@ def setup_logger(logger_name: str) -> logging.Logger:
         logging.Logger: The configured logger object.
 
     """
-    format_string = "%(filename)s:%(lineno)d [%(levelname)s] %(message)s"
-    log = logging.getLogger(logger_name)
-    log.setLevel(logging.DEBUG)
-
-    logging.Logger.addHandler(log, logging.FileHandler("nes.log", mode="a"))
-    logging.Logger.addHandler(log, RichHandler(level="DEBUG"))
-    for h in log.handlers:
-        h.setFormatter(logging.Formatter(format_string))
-    return log
+    return logging.getLogger(logger_name)
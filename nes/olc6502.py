@@ -7,18 +7,34 @@ This is the main file for the OLC6502 emulator.
 # pylint: disable=unused-variable
 
 import logging
-from numpy import uint8, uint16
-from rich.logging import RichHandler
+
 from nes.cpu import Cpu
 from nes.bus import Bus
-from nes.isa import InstructionLookupTable
+from nes.isa import InstructionLookupTable, opcode_name
 from nes.address_mode import AddressingMode
-from nes.flags import Flags
+from nes.flags import Flags, B, I, U
 from nes.address_mode_selector import AddressModeSelector
 from nes.instruction_selector import InstructionSelector
 from nes.nes_logger import setup_logger
 log = setup_logger(__name__)
 
+# Raw value of the implied mode: modes[] stores integers, so comparing
+# against this skips the IntEnum equality machinery in fetch().
+_IMP = AddressingMode.IMP.value
+
+
+def _fuse(addr_fn, op_fn, base_cycles: int):
+    """
+    Partially evaluates one opcode: the addressing-mode handler, the
+    execute handler and the base cycle count are baked in as constants,
+    so the closure returns the total cycles for one execution in a
+    single call.
+    """
+    def fused() -> int:
+        return base_cycles + (addr_fn() & op_fn())
+    return fused
+
+
 class Olc6502(Cpu):
     """
     Represents the 6502 processor in the NES emulator.
@@ -30,6 +46,18 @@ class Olc6502(Cpu):
         memory: Memory array for storing data
     """
 
+    __slots__ = (
+        "bus",
+        "_mem",
+        "stack",
+        "address_mode_selector",
+        "inst_selector",
+        "_addr_fns",
+        "_op_fns",
+        "_cycles",
+        "_fused",
+    )
+
     def __init__(self, bus: Bus):
         """
         Initializes the olc6502 object.
@@ -45,10 +73,34 @@ class Olc6502(Cpu):
         """
         super().__init__()
         self.bus: Bus = bus
+        # Direct reference to bus RAM: the bus maps the whole 64 KiB
+        # address space to this one array, so opcode and operand fetches
+        # can subscript it without a bus call per access. read()/write()
+        # remain the general (and traceable) path.
+        self._mem = bus.ram
+        # Direct view of the stack page (0x0100-0x01FF); the stack is never
+        # remapped, so push/pop can subscript this instead of going through
+        # bus address decoding.
+        self.stack = memoryview(bus.ram)[0x0100:0x0200]
         self.address_mode_selector = AddressModeSelector(self)
         self.inst_selector = InstructionSelector(self)
+        # Parallel per-opcode dispatch tables; clock() indexes these
+        # directly instead of destructuring an Instruction per tick.
+        self._addr_fns, self._op_fns, self._cycles = (
+            InstructionLookupTable.build_fast_tables(
+                self.address_mode_selector, self.inst_selector
+            )
+        )
+        # Fused per-opcode closures: one call per instruction instead of
+        # an addressing-mode call, an execute call and a cycle-table read.
+        self._fused = tuple(
+            _fuse(addr_fn, op_fn, base)
+            for addr_fn, op_fn, base in zip(
+                self._addr_fns, self._op_fns, self._cycles
+            )
+        )
 
-    def read(self, addr: uint16) -> uint8:
+    def read(self, addr: int) -> int:
         """
         Read data from the specified address.
 
@@ -58,11 +110,11 @@ class Olc6502(Cpu):
         Returns:
             The data read from the address.
         """
-        data: uint8 = self.bus.read(addr)
+        data: int = self.bus.read(addr)
 #        log.info("read %s from %s", hex(data), hex(addr))
         return data
 
-    def write(self, addr: uint16, data: uint8) -> None:
+    def write(self, addr: int, data: int) -> None:
         """
         Write data to the specified address.
 
@@ -73,7 +125,7 @@ class Olc6502(Cpu):
 #        log.info("write %s to %s", hex(data), hex(addr))
         self.bus.write(addr, data)
 
-    def get_flag(self, flag: Flags) -> uint8:
+    def get_flag(self, flag: Flags) -> int:
         """
         Retrieves the value of the specified flag from the register.
 
@@ -81,7 +133,7 @@ class Olc6502(Cpu):
         - flag (Flags): The flag to retrieve the value of.
 
         Returns:
-        - uint8: The value of the specified flag.
+        - int: The value of the specified flag.
         """
         return self.register.get_flag(flag)
 
@@ -94,6 +146,38 @@ class Olc6502(Cpu):
         """
         self.register.set_flag(flag, value)
 
+    def step(self) -> int:
+        """
+        Executes one full instruction and returns its cycle count.
+
+        Event-driven callers can advance the rest of the system by the
+        returned amount instead of ticking clock() once per cycle and
+        paying a Python call for every no-op countdown tick.
+
+        Returns:
+            int: The number of clock cycles the instruction consumed.
+        """
+        # Even a discarded log.info builds a LogRecord and walks the
+        # handler list; check the level first so silent runs pay only a
+        # cached integer compare, as Bus.read/write already do.
+        trace = log.isEnabledFor(logging.INFO)
+        reg = self.register
+        reg.status |= U
+        opcode = self._mem[reg.pc]
+        self.opcode = opcode
+        if trace:
+            log.info("PC: %s, %s", hex(reg.pc), opcode_name(opcode))
+        reg.pc = (reg.pc + 1) & 0xFFFF
+        # Branch handlers add their taken/page-cross cycles to
+        # self.cycles while the closure runs; seed it first and fold
+        # the closure's total in afterwards (left operand runs first).
+        self.cycles = 0
+        cycles = self._fused[opcode]() + self.cycles
+        if trace:
+            log.info(reg)
+        reg.status |= U
+        return cycles
+
     def clock(self):
         """
         Executes one clock cycle of the 6502 processor.
@@ -102,48 +186,80 @@ class Olc6502(Cpu):
         and executing the instruction associated with the opcode.
 
         """
-        log.info("Cycles: %s", self.cycles)
+        if log.isEnabledFor(logging.INFO):
+            log.info("Cycles: %s", self.cycles)
         if self.cycles == 0:
-            self.set_flag(Flags.U, True)
-            self.opcode = self.read(self.register.pc)
-            log.info("PC: %s, %s", hex(self.register.pc), InstructionLookupTable.opcode_lookup(self.opcode))
-            self.register.pc += 1
-            instruction = InstructionLookupTable.table[self.opcode]
-            self.cycles = instruction.cycles
-
-            addr_mode_selector = self.address_mode_selector
-            log.info("Addr mode: %s", instruction.addr_mode)
-            instr_selector = self.inst_selector
-            require_extra_cycle_from_mode = addr_mode_selector.select(
-                instruction.addr_mode
-            )
-            log.info(self.register)
-            require_extra_cycle_from_instruction = instr_selector.select(
-                instruction.opcode
-            )
-            log.info(self.register)
-
-            if require_extra_cycle_from_mode and require_extra_cycle_from_instruction:
-                self.cycles += 1
-            self.set_flag(Flags.U, True)
+            self.cycles = self.step()
 
         self.cycles -= 1
 
-    def fetch(self) -> uint8:
+    def run(self, cycle_budget: int) -> None:
+        """
+        Runs the processor for a budget of clock cycles in one call.
+
+        Equivalent to calling clock() cycle_budget times, but the
+        register file, memory, dispatch table and cycle counter live in
+        locals for the whole batch, so each tick costs loop overhead
+        instead of a fresh Python frame plus attribute loads.
+
+        Args:
+            cycle_budget: The number of clock cycles to execute.
+        """
+        if log.isEnabledFor(logging.INFO):
+            # Tracing wants the exact per-tick log output; take the
+            # unbatched path so the two stay identical.
+            for _ in range(cycle_budget):
+                self.clock()
+            return
+
+        reg = self.register
+        mem = self._mem
+        fused = self._fused
+        cycles = self.cycles
+        while cycle_budget > 0:
+            if cycles == 0:
+                reg.status |= U
+                opcode = mem[reg.pc]
+                self.opcode = opcode
+                reg.pc = (reg.pc + 1) & 0xFFFF
+                self.cycles = 0
+                cycles = fused[opcode]() + self.cycles
+                reg.status |= U
+            # Consume the instruction's cycles (or what remains of the
+            # budget) in one subtraction instead of ticking one by one.
+            take = cycles if cycles < cycle_budget else cycle_budget
+            cycles -= take
+            cycle_budget -= take
+        self.cycles = cycles
+
+    def _read16(self, addr: int) -> int:
+        """
+        Reads a little-endian 16-bit word from memory.
+
+        One C-level slice-and-decode replaces the two bus reads and the
+        shift/or recombination the vector fetches used to do.
+
+        Args:
+            addr: The address of the low byte.
+
+        Returns:
+            int: The 16-bit word at the address.
+        """
+        return int.from_bytes(self._mem[addr:addr + 2], "little")
+
+    def fetch(self) -> int:
         """
         Fetches the next instruction from memory.
 
         Returns:
-            uint8: The fetched instruction.
+            int: The fetched instruction.
 
         Raises:
             None
 
         """
-        instruction = InstructionLookupTable.table[self.opcode]
-        addr_mode = instruction.addr_mode
-        if addr_mode != AddressingMode.IMP:
-            self.fetched = self.read(self.addr_abs)
+        if InstructionLookupTable.modes[self.opcode] != _IMP:
+            self.fetched = self._mem[self.addr_abs]
         return self.fetched
 
     def reset(self) -> None:
@@ -154,22 +270,21 @@ class Olc6502(Cpu):
         address stored at the reset vector.
 
         """
-        self.addr_abs = uint16(0xFFFC)
-        lo = self.read(self.addr_abs)
-        hi = self.read(self.addr_abs + 1)
-        self.register.pc = uint16(uint16(uint16(hi) << 8) | uint16(lo))
+        reg = self.register
+        self.addr_abs = 0xFFFC
+        reg.pc = self._read16(self.addr_abs)
 
-        self.register.a = uint8(0)
-        self.register.x = uint8(0)
-        self.register.y = uint8(0)
-        self.register.stkp = uint8(0xFD)
-        self.register.status = uint8(0x00 | Flags.U.value)
+        reg.a = 0
+        reg.x = 0
+        reg.y = 0
+        reg.stkp = 0xFD
+        reg.status = U
 
-        self.addr_rel = uint16(0)
-        self.addr_abs = uint16(0)
-        self.fetched = uint8(0)
+        self.addr_rel = 0
+        self.addr_abs = 0
+        self.fetched = 0
 
-        self.cycles = uint8(8)
+        self.cycles = 8
 
     def irq(self) -> None:
         """
@@ -179,29 +294,24 @@ class Olc6502(Cpu):
         address stored at the interrupt vector.
 
         """
-        if self.get_flag(Flags.I) == 0:
-            self.write(
-                0x0100 + self.register.stkp,
-                uint8(uint16(self.register.pc >> 8) & 0x00FF),
-            )
-            self.register.stkp -= 1
-            self.write(
-                0x0100 + self.register.stkp, uint8(uint16(self.register.pc) & 0x00FF)
-            )
-            self.register.stkp -= 1
+        if not self.register.status & I:
+            reg = self.register
+            stack = self.stack
+            pc = reg.pc
+            stkp = reg.stkp
+            stack[stkp] = (pc >> 8) & 0x00FF
+            stack[(stkp - 1) & 0xFF] = pc & 0x00FF
 
-            self.set_flag(Flags.B, False)
-            self.set_flag(Flags.U, True)
-            self.set_flag(Flags.I, True)
-            self.write(0x0100 + self.register.stkp, self.register.status)
-            self.register.stkp -= 1
+            # B is clear and U/I set on the pushed copy and in the live
+            # register, folded into one status write.
+            reg.status = (reg.status | U | I) & ~B
+            stack[(stkp - 2) & 0xFF] = reg.status
+            reg.stkp = (stkp - 3) & 0xFF
 
-            self.addr_abs = uint16(0xFFFE)
-            lo = self.read(self.addr_abs)
-            hi = self.read(self.addr_abs + 1)
-            self.register.pc = uint16(uint16(uint16(hi) << 8) | uint16(lo))
+            self.addr_abs = 0xFFFE
+            reg.pc = self._read16(self.addr_abs)
 
-            self.cycles = uint8(7)
+            self.cycles = 7
 
     def nmi(self) -> None:
         """
@@ -212,24 +322,18 @@ class Olc6502(Cpu):
         non-maskable interrupt vector.
 
         """
-        self.write(
-            0x0100 + self.register.stkp, uint8(uint16(self.register.pc >> 8) & 0x00FF)
-        )
-        self.register.stkp -= 1
-        self.write(
-            0x0100 + self.register.stkp, uint8(uint16(self.register.pc) & 0x00FF)
-        )
-        self.register.stkp -= 1
+        reg = self.register
+        stack = self.stack
+        pc = reg.pc
+        stkp = reg.stkp
+        stack[stkp] = (pc >> 8) & 0x00FF
+        stack[(stkp - 1) & 0xFF] = pc & 0x00FF
 
-        self.set_flag(Flags.B, False)
-        self.set_flag(Flags.U, True)
-        self.set_flag(Flags.I, True)
-        self.write(0x0100 + self.register.stkp, self.register.status)
-        self.register.stkp -= 1
+        reg.status = (reg.status | U | I) & ~B
+        stack[(stkp - 2) & 0xFF] = reg.status
+        reg.stkp = (stkp - 3) & 0xFF
 
-        self.addr_abs = uint16(0xFFFA)
-        lo = self.read(self.addr_abs)
-        hi = self.read(self.addr_abs + 1)
-        self.register.pc = uint16(uint16(uint16(hi) << 8) | uint16(lo))
+        self.addr_abs = 0xFFFA
+        reg.pc = self._read16(self.addr_abs)
 
-        self.cycles = uint8(8)
+        self.cycles = 8
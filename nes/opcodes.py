@@ -2,68 +2,67 @@
 This module contains the opcode definitions for the 6502 processor.
 """
 import enum
-from numpy import uint8
 
 class Opcodes(enum.Enum):
     """
     Enumeration representing the opcodes used in the NES emulator.
-    Each opcode is assigned a unique uint8 value.
+    Each opcode is assigned a unique 8-bit value.
     """
 
-    BRK = uint8(0)
-    ORA = uint8(1)
-    ASL = uint8(2)
-    BPL = uint8(3)
-    CLC = uint8(4)
-    JSR = uint8(5)
-    AND = uint8(6)
-    ROL = uint8(7)
-    BIT = uint8(8)
-    PLP = uint8(9)
-    BMI = uint8(10)
-    SEC = uint8(11)
-    RTI = uint8(12)
-    EOR = uint8(13)
-    LSR = uint8(14)
-    PHA = uint8(15)
-    JMP = uint8(16)
-    BVC = uint8(17)
-    CLI = uint8(18)
-    RTS = uint8(19)
-    ADC = uint8(20)
-    ROR = uint8(21)
-    STA = uint8(22)
-    STX = uint8(23)
-    STY = uint8(24)
-    DEY = uint8(25)
-    TXA = uint8(26)
-    BCC = uint8(27)
-    TYA = uint8(28)
-    TXS = uint8(29)
-    LDY = uint8(30)
-    TAY = uint8(31)
-    BCS = uint8(32)
-    LDA = uint8(33)
-    LDX = uint8(34)
-    TAX = uint8(35)
-    CLV = uint8(36)
-    TSX = uint8(37)
-    CPY = uint8(38)
-    INY = uint8(39)
-    CMP = uint8(40)
-    DEC = uint8(41)
-    DEX = uint8(42)
-    PLA = uint8(43)
-    BNE = uint8(44)
-    CLD = uint8(45)
-    CPX = uint8(46)
-    SBC = uint8(47)
-    INC = uint8(48)
-    INX = uint8(49)
-    NOP = uint8(50)
-    BEQ = uint8(51)
-    SED = uint8(52)
-    BVS = uint8(53)
-    SEI = uint8(54)
-    PHP = uint8(55)
-    JAM = uint8(255)
+    BRK = 0
+    ORA = 1
+    ASL = 2
+    BPL = 3
+    CLC = 4
+    JSR = 5
+    AND = 6
+    ROL = 7
+    BIT = 8
+    PLP = 9
+    BMI = 10
+    SEC = 11
+    RTI = 12
+    EOR = 13
+    LSR = 14
+    PHA = 15
+    JMP = 16
+    BVC = 17
+    CLI = 18
+    RTS = 19
+    ADC = 20
+    ROR = 21
+    STA = 22
+    STX = 23
+    STY = 24
+    DEY = 25
+    TXA = 26
+    BCC = 27
+    TYA = 28
+    TXS = 29
+    LDY = 30
+    TAY = 31
+    BCS = 32
+    LDA = 33
+    LDX = 34
+    TAX = 35
+    CLV = 36
+    TSX = 37
+    CPY = 38
+    INY = 39
+    CMP = 40
+    DEC = 41
+    DEX = 42
+    PLA = 43
+    BNE = 44
+    CLD = 45
+    CPX = 46
+    SBC = 47
+    INC = 48
+    INX = 49
+    NOP = 50
+    BEQ = 51
+    SED = 52
+    BVS = 53
+    SEI = 54
+    PHP = 55
+    JAM = 255
@@ -2,14 +2,21 @@
 This module contains the Register class, which represents the CPU registers in an NES emulator.
 """
 import dataclasses
-from numpy import uint8, uint16
 from nes.flags import Flags
 
-@dataclasses.dataclass
+# Bit position of each (power-of-two) flag, so get_flag is a shift
+# instead of a mask-and-compare.
+_BIT = {flag: flag.value.bit_length() - 1 for flag in Flags}
+
+
+@dataclasses.dataclass(slots=True)
 class Register:
     """
     Represents the CPU registers in an NES emulator.
 
+    All fields are plain Python ints; callers mask values to 8 or 16 bits
+    on store instead of relying on a fixed-width dtype to wrap.
+
     Attributes:
         a (int): The accumulator register.
         x (int): The X register.
@@ -18,12 +25,12 @@ class Register:
         pc (int): The program counter register.
         status (int): The status register.
     """
-    a: uint8
-    x: uint8
-    y: uint8
-    stkp: uint8
-    pc: uint16
-    status: uint8
+    a: int
+    x: int
+    y: int
+    stkp: int
+    pc: int
+    status: int
 
     def __str__(self) -> str:
         return f"Register(A={self.a}, X={self.x}, Y={self.y}, " \
@@ -32,7 +39,7 @@ class Register:
     def __repr__(self) -> str:
         return str(self)
 
-    def get_flag(self, flag: Flags) -> uint8:
+    def get_flag(self, flag: Flags) -> int:
         """
         Retrieves the value of the specified flag from the status register.
 
@@ -40,9 +47,9 @@ class Register:
             flag (Flags): The flag to retrieve the value of.
 
         Returns:
-            uint8: The value of the specified flag (1 if set, 0 if not set).
+            int: The value of the specified flag (1 if set, 0 if not set).
         """
-        return uint8(1) if self.status & uint8(flag.value) > 0 else uint8(0)
+        return (self.status >> _BIT[flag]) & 1
 
     def set_flag(self, flag: Flags, value: bool) -> None:
         """
@@ -52,7 +59,7 @@ class Register:
             flag (Flags): The flag to be set.
             value (bool): The value to set the flag to.
         """
-        if value:
-            self.status |= uint8(flag.value)
-        else:
-            self.status &= ~flag.value # pylint: disable=*
+        mask = flag.value
+        # -bool(value) is 0 or -1 (all ones), so the flag bit is merged
+        # in or cleared without a data-dependent branch.
+        self.status = (self.status & (0xFF ^ mask)) | (-bool(value) & mask)
@@ -23,7 +23,7 @@ class TestBus(unittest.TestCase):
         """
         bus = Bus()
         with self.assertRaises(IndexError):
-            bus.write(0xFFFF + 1, 0xCD) # type: ignore
+            bus.debug_write(0xFFFF + 1, 0xCD) # type: ignore
 
     def test_write_data(self):
         """
@@ -53,7 +53,7 @@ class TestBus(unittest.TestCase):
         Test reading data from an invalid address.
         """
         bus = Bus()
-        result = bus.read(0xFFFFF) # type: ignore
+        result = bus.debug_read(0xFFFFF) # type: ignore
         self.assertEqual(result, 0x00)
 
     def test_read_data(self):